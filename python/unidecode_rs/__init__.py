@@ -9,7 +9,8 @@ compiled functions.
 """
 from __future__ import annotations
 
-from typing import Optional
+import warnings
+from typing import Iterable, List, Optional
 
 # Import the compiled extension implementation from the compiled module.
 # When installed via maturin, the compiled extension is available as
@@ -19,6 +20,8 @@ try:
         unidecode as _unidecode_impl,
         unidecode_expect_ascii as _unidecode_expect_ascii_impl,
         unidecode_expect_nonascii as _unidecode_expect_nonascii_impl,
+        _unidecode_many as _unidecode_many_impl,
+        _strip_surrogates as _strip_surrogates_impl,
         UnidecodeError,
     )
 except Exception:  # pragma: no cover - compiled extension may be absent
@@ -27,43 +30,59 @@ except Exception:  # pragma: no cover - compiled extension may be absent
     _unidecode_impl = None  # type: ignore
     _unidecode_expect_ascii_impl = None  # type: ignore
     _unidecode_expect_nonascii_impl = None  # type: ignore
+    _unidecode_many_impl = None  # type: ignore
+    _strip_surrogates_impl = None  # type: ignore
     UnidecodeError = Exception  # type: ignore
 # (no further action needed; variables are set above)
 
+_warn = warnings.warn
+
 __all__ = [
     "unidecode",
     "unidecode_expect_ascii",
     "unidecode_expect_nonascii",
+    "unidecode_many",
     "UnidecodeError",
 ]
 
 
-def unidecode(
-    string: str,
-    errors: Optional[str] = None,
-    replace_str: Optional[str] = None,
-) -> str:
-    """Transliterate text to ASCII.
+def _warn_surrogates(count: int, stacklevel: int) -> None:
+    """Emit upstream's per-surrogate RuntimeWarning *count* times."""
+    for _ in range(count):
+        _warn(
+            "Surrogate character %r will be ignored. "
+            "You might be using a narrow Python build.",
+            RuntimeWarning,
+            stacklevel=stacklevel,
+        )
 
-    Signature matches upstream: (string, errors=None, replace_str=None)
-    """
-    assert _unidecode_impl is not None
-
-    # Handle surrogate code units on narrow builds: warn and remove them.
-    surrogate_count = sum(1 for ch in string if 0xd800 <= ord(ch) <= 0xdfff)
-    if surrogate_count:
-        import warnings
-        for _ in range(surrogate_count):
-            warnings.warn(
-                "Surrogate character %r will be ignored. "
-                "You might be using a narrow Python build.",
-                RuntimeWarning,
-                stacklevel=2,
-            )
-        string = ''.join(ch for ch in string if not (0xd800 <= ord(ch) <= 0xdfff))
 
+def _preprocess(string: str) -> str:
+    """Warn about and strip surrogate code units (narrow build leftovers)."""
+    # str.isascii() is a flag check on PEP 393 strings, so ASCII input never
+    # pays for the scan. Lone surrogates can still appear on wide builds
+    # (e.g. '\ud800' literals), so non-ASCII input is always checked. The
+    # extension detects and strips them in one pass and hands the caller's
+    # object back untouched in the common case.
+    if str.isascii(string):
+        return string
+    string, surrogate_count = _strip_surrogates_impl(string)
+    # _warn_surrogates -> _preprocess -> _invoke -> public wrapper -> caller
+    _warn_surrogates(surrogate_count, stacklevel=5)
+    return string
+
+
+def _invoke(impl, string, errors, replace_str):
+    """Single code path shared by the public wrappers below."""
+    assert impl is not None
+    # ASCII transliterates to itself. str.isascii (rather than the bound
+    # method) still rejects non-str arguments with TypeError. Explicit
+    # errors= values go through the extension so they are validated.
+    if errors is None and str.isascii(string):
+        return string
+    string = _preprocess(string)
     try:
-        return _unidecode_impl(string, errors, replace_str)
+        return impl(string, errors, replace_str)
     except UnidecodeError:
         # If the Rust impl raises UnidecodeError for 'invalid' mode,
         # we need to catch it and return the original string (preserve behavior)
@@ -72,9 +91,23 @@ def unidecode(
         raise
 
 
-# Note: We don't set __text_signature__ on the Python wrapper because
-# inspect.signature() correctly introspects Python function signatures.
-# If needed for C extension compatibility, copy from _unidecode_impl.
+def unidecode(
+    string: str,
+    errors: Optional[str] = None,
+    replace_str: Optional[str] = None,
+) -> str:
+    """Transliterate text to ASCII.
+
+    Signature matches upstream: (string, errors=None, replace_str=None)
+    """
+    return _invoke(_unidecode_impl, string, errors, replace_str)
+
+
+# Note: We don't set __text_signature__ on the Python wrappers. For Python
+# functions inspect.signature() honours it, but then parses the string with
+# ast (roughly 8x slower than reading the code object) and loses the
+# annotations. Precomputing __signature__ would require importing inspect
+# at module load, which costs every user startup time.
 
 
 def unidecode_expect_ascii(
@@ -85,18 +118,7 @@ def unidecode_expect_ascii(
     """Alias matching upstream: unidecode_expect_ascii(
     string, errors, replace_str)
     """
-    assert _unidecode_expect_ascii_impl is not None
-    surrogate_count = sum(1 for ch in string if 0xd800 <= ord(ch) <= 0xdfff)
-    if surrogate_count:
-        import warnings
-        for _ in range(surrogate_count):
-            warnings.warn(
-                "Surrogate character %r will be ignored. You might be using a narrow Python build.",
-                RuntimeWarning,
-                stacklevel=2,
-            )
-        string = ''.join(ch for ch in string if not (0xd800 <= ord(ch) <= 0xdfff))
-    return _unidecode_expect_ascii_impl(string, errors, replace_str)
+    return _invoke(_unidecode_expect_ascii_impl, string, errors, replace_str)
 
 
 def unidecode_expect_nonascii(
@@ -107,15 +129,34 @@ def unidecode_expect_nonascii(
     """Alias matching upstream: unidecode_expect_nonascii(
     string, errors, replace_str)
     """
-    assert _unidecode_expect_nonascii_impl is not None
-    surrogate_count = sum(1 for ch in string if 0xd800 <= ord(ch) <= 0xdfff)
-    if surrogate_count:
-        import warnings
-        for _ in range(surrogate_count):
-            warnings.warn(
-                "Surrogate character %r will be ignored. You might be using a narrow Python build.",
-                RuntimeWarning,
-                stacklevel=2,
-            )
-        string = ''.join(ch for ch in string if not (0xd800 <= ord(ch) <= 0xdfff))
-    return _unidecode_expect_nonascii_impl(string, errors, replace_str)
+    return _invoke(_unidecode_expect_nonascii_impl, string, errors, replace_str)
+
+
+def unidecode_many(
+    strings: Iterable[str],
+    errors: Optional[str] = None,
+    replace_str: Optional[str] = None,
+) -> List[str]:
+    """Transliterate every string in *strings* and return the results as a list.
+
+    Equivalent to ``[unidecode(s, errors, replace_str) for s in strings]`` but
+    crosses into the extension once for the whole batch, which pays off for
+    many short inputs (tokens, CSV cells, log lines).
+
+    With ``errors='strict'`` the first failing entry raises
+    ``UnidecodeError``; ``item`` is its position in *strings* and ``index``
+    the position of the offending character within it.
+    """
+    assert _unidecode_many_impl is not None
+    # A str is itself an iterable of str; iterating it would silently
+    # transliterate character by character. The extension rejects it too.
+    if isinstance(strings, str):
+        raise TypeError("unidecode_many() expects an iterable of str, not str")
+    if not isinstance(strings, (list, tuple)):
+        strings = list(strings)  # the extension takes a sequence
+    # The extension strips lone surrogates itself and reports how many it
+    # removed, so the batch stays a single call.
+    results, surrogate_count = _unidecode_many_impl(strings, errors, replace_str)
+    # _warn_surrogates -> unidecode_many -> caller
+    _warn_surrogates(surrogate_count, stacklevel=3)
+    return results
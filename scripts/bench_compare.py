@@ -12,12 +12,18 @@ import os
 from pathlib import Path
 
 
+SAMPLE_LINE = "C'est déjà l'été! Привет мир! こんにちは 世界 🌍\n"
+SAMPLE_REPEAT = 10000
+
+
 def prepare_sample(path: Path) -> str:
-    if not path.exists():
-        text = "C'est déjà l'été! Привет мир! こんにちは 世界 🌍\n"
-        text = text * 10000
-        path.write_text(text, encoding="utf8")
-    return path.read_text(encoding="utf8")
+    if path.exists():
+        return path.read_text(encoding="utf8")
+    # Encode the line once and repeat the bytes, instead of running the
+    # encoder over the whole ~700 KB text in write_text().
+    path.write_bytes(SAMPLE_LINE.encode("utf8") * SAMPLE_REPEAT)
+    # Freshly generated: return the in-memory text instead of reading it back.
+    return SAMPLE_LINE * SAMPLE_REPEAT
 
 
 def main() -> None:
@@ -71,11 +77,12 @@ def main() -> None:
     except Exception as exc:
         print("rust extension import failed:", exc)
 
-    # warmup
+    # warmup (slice once, outside any timed region)
     print("warming up...")
-    py_unidecode.unidecode(text[:1000])
+    warmup = text[:1000]
+    py_unidecode.unidecode(warmup)
     if rust_fn:
-        rust_fn(text[:1000])
+        rust_fn(warmup)
 
     # benchmark python unidecode
     print("benchmarking python unidecode...")
@@ -92,8 +99,10 @@ def main() -> None:
         t1 = time.perf_counter()
         print("rust time:", t1 - t0)
 
-        # compare outputs (first 200 chars)
-        print("outputs equal (prefix):", py_out[:200] == rust_out[:200])
+        # compare full outputs: str equality checks length first, then
+        # memcmp's the buffers, so this stays cheap when outputs match.
+        print("outputs equal:", py_out == rust_out)
+        print("output lengths (python, rust):", len(py_out), len(rust_out))
 
 
 if __name__ == "__main__":
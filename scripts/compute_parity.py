@@ -7,13 +7,19 @@ print the pass/fail counts and percentage parity.
 """
 import importlib
 import importlib.util
+import multiprocessing
 import sys
 import os
 import io
+import re
 import types
 import unittest
 import warnings
 
+# Surrogate detection/stripping in C: Pattern.subn removes surrogates and
+# counts them in a single pass, without a per-character Python loop.
+_SURR_RE = re.compile('[\ud800-\udfff]')
+
 
 def _load_rust_module():
     try:
@@ -53,15 +59,13 @@ def _inject_proxy(rust_mod):
     def _wrap_call(impl, string, errors=None, replace_str=None):
         if errors == 'invalid':
             raise UnidecodeError("invalid value for errors parameter %r" % (errors,))
-        surrogate_count = sum(1 for ch in string if 0xd800 <= ord(ch) <= 0xdfff)
-        if surrogate_count:
-            for _ in range(surrogate_count):
-                warnings.warn(
-                    "Surrogate character %r will be ignored. You might be using a narrow Python build.",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
-            string = ''.join(ch for ch in string if not (0xd800 <= ord(ch) <= 0xdfff))
+        string, surrogate_count = _SURR_RE.subn('', string)
+        for _ in range(surrogate_count):
+            warnings.warn(
+                "Surrogate character %r will be ignored. You might be using a narrow Python build.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
         return impl(string, errors, replace_str)
 
     if impl_unidecode is not None:
@@ -94,12 +98,9 @@ def _collect_upstream_tests():
     if upstream_tests_dir is None:
         raise FileNotFoundError('Could not locate upstream unidecode/tests directory')
 
-    paths = []
-    for fn in os.listdir(upstream_tests_dir):
-        if not fn.endswith('.py'):
-            continue
-        paths.append(os.path.join(upstream_tests_dir, fn))
-    return sorted(paths)
+    # DirEntry carries the file type from readdir, so no extra stat() per entry.
+    with os.scandir(upstream_tests_dir) as it:
+        return sorted(e.path for e in it if e.name.endswith('.py') and e.is_file())
 
 
 def _run_module(path):
@@ -114,25 +115,30 @@ def _run_module(path):
     return result, buf.getvalue()
 
 
+def _init_worker():
+    # Each worker needs its own proxy: sys.modules state does not carry over
+    # to spawn-started processes (macOS / Windows default).
+    _inject_proxy(_load_rust_module())
+
+
+def _run_module_path(path):
+    # TestResult objects are not picklable; return plain counts and output.
+    result, out = _run_module(path)
+    return path, result.testsRun, len(result.failures), len(result.errors), out
+
+
 def main():
-    rust = _load_rust_module()
-    _inject_proxy(rust)
-    tests = _collect_upstream_tests()
-    total = 0
-    passed = 0
-    failed = 0
-    errored = 0
-    details = []
-    for path in tests:
-        # skip the utility test (subprocess-driven) by default
-        if os.path.basename(path) == 'test_utility.py':
-            continue
-        result, out = _run_module(path)
-        total += result.testsRun
-        failed += len(result.failures)
-        errored += len(result.errors)
-        passed += result.testsRun - (len(result.failures) + len(result.errors))
-        details.append((path, result.testsRun, len(result.failures), len(result.errors), out))
+    # Fail fast in the parent if the extension cannot be loaded at all.
+    _load_rust_module()
+    # skip the utility test (subprocess-driven) by default
+    tests = [p for p in _collect_upstream_tests() if os.path.basename(p) != 'test_utility.py']
+    # Upstream modules are independent, so run them concurrently.
+    with multiprocessing.Pool(initializer=_init_worker) as pool:
+        details = pool.map(_run_module_path, tests)
+    total = sum(tr for _, tr, _, _, _ in details)
+    failed = sum(f for _, _, f, _, _ in details)
+    errored = sum(e for _, _, _, e, _ in details)
+    passed = total - (failed + errored)
 
     parity = (passed / total * 100.0) if total else 0.0
     print('Upstream test modules run:', len(details))
@@ -361,6 +361,36 @@ fn transliterate_internal(input: &str, policy: ErrorsPolicy<'_>) -> Transliterat
     TransliterationResult(out, None)
 }
 
+/// Remove UTF-8-encoded surrogate code points from `bytes` and count them.
+///
+/// Python strings may carry lone surrogates (U+D800..U+DFFF), which cannot
+/// be represented in a Rust `str`. The Python binding encodes such strings
+/// with `surrogatepass`, producing `ED A0..BF xx` sequences; a valid UTF-8
+/// `ED` lead is only ever followed by `80..9F`, so the second byte alone
+/// identifies a surrogate. Candidates are located with `memchr` (SIMD
+/// accelerated) and the input is borrowed when nothing needs removing.
+#[cfg_attr(not(feature = "python"), allow(dead_code))]
+pub(crate) fn strip_surrogate_bytes(bytes: &[u8]) -> (Cow<'_, [u8]>, usize) {
+    let mut out: Option<Vec<u8>> = None;
+    let mut count = 0usize;
+    let mut last = 0usize;
+    for pos in memchr::memchr_iter(0xED, bytes) {
+        if bytes.get(pos + 1).is_some_and(|&b| b >= 0xA0) {
+            let buf = out.get_or_insert_with(|| Vec::with_capacity(bytes.len()));
+            buf.extend_from_slice(&bytes[last..pos]);
+            last = (pos + 3).min(bytes.len());
+            count += 1;
+        }
+    }
+    match out {
+        None => (Cow::Borrowed(bytes), 0),
+        Some(mut buf) => {
+            buf.extend_from_slice(&bytes[last..]);
+            (Cow::Owned(buf), count)
+        }
+    }
+}
+
 // (legacy alias removed)
 
 #[cfg(test)]
@@ -536,6 +566,24 @@ mod tests {
         );
     }
 
+    #[test]
+    fn strip_surrogate_bytes_borrows_when_clean() {
+        // U+D7FF and U+E000 share the ED / EE lead bytes region but are not surrogates.
+        let s = "a\u{D7FF}b\u{E000}c é";
+        let (out, count) = strip_surrogate_bytes(s.as_bytes());
+        assert!(matches!(out, Cow::Borrowed(_)));
+        assert_eq!(count, 0);
+    }
+
+    #[test]
+    fn strip_surrogate_bytes_removes_encoded_surrogates() {
+        // "a" + U+D800 + "é" + U+DFFF as produced by Python's 'surrogatepass'.
+        let bytes = b"a\xED\xA0\x80\xC3\xA9\xED\xBF\xBF";
+        let (out, count) = strip_surrogate_bytes(bytes);
+        assert_eq!(count, 2);
+        assert_eq!(&*out, "aé".as_bytes());
+    }
+
     #[test]
     fn cow_borrowed_for_ascii() {
         // Test that ASCII strings return Cow::Borrowed (zero-copy)
@@ -1,9 +1,13 @@
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
+use pyo3::types::{PyBytes, PyString};
+#[cfg(feature = "python")]
 use pyo3::wrap_pyfunction;
 #[cfg(feature = "python")]
 use pyo3::{create_exception, exceptions::PyException};
+#[cfg(feature = "python")]
+use std::borrow::Cow;
 
 // Define custom exception at module level so we can construct it easily.
 #[cfg(feature = "python")]
@@ -17,9 +21,51 @@ create_exception!(unidecode_rs, UnidecodeError, PyException);
 // generated types.
 #[pyfunction(signature = (string, errors=None, replace_str=None), text_signature = "(string, errors=None, replace_str=None)")]
 /// Transliterates a Unicode string to ASCII (mirror of Python `unidecode.unidecode`).
-fn unidecode(string: &str, errors: Option<&str>, replace_str: Option<&str>) -> PyResult<String> {
-    // string is already a &str reference, no need for to_string() conversion
-    // Only convert to String when necessary for the result
+fn unidecode(
+    string: &Bound<'_, PyString>,
+    errors: Option<&str>,
+    replace_str: Option<&str>,
+) -> PyResult<String> {
+    // `to_str` wraps `PyUnicode_AsUTF8AndSize`: it borrows the UTF-8 buffer
+    // CPython caches on the str object, so repeated calls with the same
+    // object do not copy the input.
+    transliterate(string.py(), string.to_str()?, errors, replace_str)
+}
+
+/// Inputs at least this long (in UTF-8 bytes) are transliterated with the
+/// GIL released. Below it, detaching and re-attaching costs more than the
+/// transliteration itself, so short strings keep the GIL.
+#[cfg(feature = "python")]
+const DETACH_MIN_LEN: usize = 4 * 1024;
+
+#[cfg(feature = "python")]
+/// Shared implementation behind the exported functions, operating on the
+/// borrowed UTF-8 view of the Python string.
+fn transliterate(
+    py: Python<'_>,
+    string: &str,
+    errors: Option<&str>,
+    replace_str: Option<&str>,
+) -> PyResult<String> {
+    let policy = parse_policy(errors, replace_str)?;
+    // The transliteration touches no Python objects: the borrowed buffer
+    // stays valid while the caller holds the str, so other Python threads
+    // can run meanwhile. The result is converted to a PyString once the
+    // GIL is re-acquired.
+    let result = if string.len() >= DETACH_MIN_LEN {
+        py.detach(|| crate::unidecode_with_policy_result(string, policy))
+    } else {
+        crate::unidecode_with_policy_result(string, policy)
+    };
+    result.map_err(strict_error)
+}
+
+#[cfg(feature = "python")]
+/// Map the upstream `errors` / `replace_str` arguments onto an `ErrorsPolicy`.
+fn parse_policy<'a>(
+    errors: Option<&str>,
+    replace_str: Option<&'a str>,
+) -> PyResult<crate::ErrorsPolicy<'a>> {
     use crate::ErrorsPolicy;
     let policy = match errors.unwrap_or("") {
         "" => ErrorsPolicy::Default,
@@ -42,27 +88,145 @@ fn unidecode(string: &str, errors: Option<&str>, replace_str: Option<&str>) -> P
             )));
         }
     };
-    match crate::unidecode_with_policy_result(string, policy) {
-        Ok(s) => Ok(s),
-        Err(idx) => {
-            // Create error instance of UnidecodeError, attach index attribute, raise.
-            let err = UnidecodeError::new_err("unidecode strict error");
-            #[allow(deprecated)]
-            {
-                Python::with_gil(|py| {
-                    let _ = err.value(py).setattr("index", idx);
-                });
+    Ok(policy)
+}
+
+#[cfg(feature = "python")]
+/// Build the `UnidecodeError` raised in strict mode, carrying the failing index.
+fn strict_error(idx: usize) -> PyErr {
+    // Create error instance of UnidecodeError, attach index attribute, raise.
+    let err = UnidecodeError::new_err("unidecode strict error");
+    #[allow(deprecated)]
+    {
+        Python::with_gil(|py| {
+            let _ = err.value(py).setattr("index", idx);
+        });
+    }
+    err
+}
+
+#[cfg(feature = "python")]
+#[pyfunction(signature = (strings, errors=None, replace_str=None), text_signature = "(strings, errors=None, replace_str=None)")]
+/// Transliterates every string in `strings`, crossing the FFI boundary once.
+///
+/// Batches of at least `DETACH_MIN_LEN` bytes in total are processed with
+/// the GIL released; in strict mode the first failing entry raises
+/// `UnidecodeError` with its position in `strings` as `item` and the
+/// in-string position as `index`.
+fn unidecode_many(
+    py: Python<'_>,
+    strings: Vec<Bound<'_, PyString>>,
+    errors: Option<&str>,
+    replace_str: Option<&str>,
+) -> PyResult<Vec<String>> {
+    let policy = parse_policy(errors, replace_str)?;
+    // Borrow every UTF-8 buffer up front while attached; the `Bound`
+    // references keep the str objects alive for the whole batch.
+    let inputs = strings
+        .iter()
+        .map(|s| s.to_str().map(Cow::Borrowed))
+        .collect::<PyResult<Vec<Cow<'_, str>>>>()?;
+    transliterate_many(py, &inputs, policy)
+}
+
+#[cfg(feature = "python")]
+#[pyfunction(signature = (strings, errors=None, replace_str=None), text_signature = "(strings, errors=None, replace_str=None)")]
+#[pyo3(name = "_unidecode_many")]
+/// `unidecode_many` for the Python shim, returning `(results, surrogates)`.
+///
+/// Entries holding lone surrogates are stripped here rather than rejected,
+/// and the number removed across the batch is returned so the shim can
+/// warn without a separate call into the extension per entry.
+fn unidecode_many_stripping(
+    py: Python<'_>,
+    strings: Vec<Bound<'_, PyString>>,
+    errors: Option<&str>,
+    replace_str: Option<&str>,
+) -> PyResult<(Vec<String>, usize)> {
+    let policy = parse_policy(errors, replace_str)?;
+    let mut surrogates = 0usize;
+    let inputs = strings
+        .iter()
+        .map(|s| match s.to_str() {
+            Ok(borrowed) => Ok(Cow::Borrowed(borrowed)),
+            // Only lone surrogates make the UTF-8 view fail.
+            Err(_) => {
+                let (cleaned, count) = strip_encoded_surrogates(s)?;
+                surrogates += count;
+                Ok(Cow::Owned(cleaned))
             }
-            Err(err)
-        }
+        })
+        .collect::<PyResult<Vec<Cow<'_, str>>>>()?;
+    Ok((transliterate_many(py, &inputs, policy)?, surrogates))
+}
+
+#[cfg(feature = "python")]
+/// Batch core shared by `unidecode_many` and `_unidecode_many`.
+fn transliterate_many(
+    py: Python<'_>,
+    inputs: &[Cow<'_, str>],
+    policy: crate::ErrorsPolicy<'_>,
+) -> PyResult<Vec<String>> {
+    let run = || {
+        inputs
+            .iter()
+            .enumerate()
+            .map(|(item, s)| {
+                crate::unidecode_with_policy_result(s, policy).map_err(|idx| (item, idx))
+            })
+            .collect::<Result<Vec<String>, (usize, usize)>>()
+    };
+    // Same threshold as `transliterate`, applied to the whole batch: empty
+    // and small batches are not worth the detach / re-attach round trip.
+    let total: usize = inputs.iter().map(|s| s.len()).sum();
+    let result = if total >= DETACH_MIN_LEN {
+        py.detach(run)
+    } else {
+        run()
+    };
+    result.map_err(|(item, idx)| {
+        let err = strict_error(idx);
+        let _ = err.value(py).setattr("item", item);
+        err
+    })
+}
+
+#[cfg(feature = "python")]
+#[pyfunction(signature = (string), text_signature = "(string)")]
+#[pyo3(name = "_strip_surrogates")]
+/// Returns `(string, count)` with lone surrogate code units removed.
+///
+/// A successful UTF-8 view proves there are no surrogates, so the common
+/// case returns the original object without scanning (and leaves CPython's
+/// cached UTF-8 buffer warm for the transliteration call that follows).
+fn strip_surrogates<'py>(
+    py: Python<'py>,
+    string: &Bound<'py, PyString>,
+) -> PyResult<(Bound<'py, PyString>, usize)> {
+    if string.to_str().is_ok() {
+        return Ok((string.clone(), 0));
     }
+    let (cleaned, count) = strip_encoded_surrogates(string)?;
+    Ok((PyString::new(py, &cleaned), count))
+}
+
+#[cfg(feature = "python")]
+/// Encode `string` with `surrogatepass` and drop the encoded surrogates.
+fn strip_encoded_surrogates(string: &Bound<'_, PyString>) -> PyResult<(String, usize)> {
+    let encoded = string
+        .call_method1("encode", ("utf-8", "surrogatepass"))?
+        .downcast_into::<PyBytes>()?;
+    let (cleaned, count) = crate::strip_surrogate_bytes(encoded.as_bytes());
+    let cleaned = String::from_utf8(cleaned.into_owned())
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+    Ok((cleaned, count))
 }
 
 #[cfg(feature = "python")]
 #[pyfunction(signature = (string, errors=None, replace_str=None), text_signature = "(string, errors=None, replace_str=None)")]
 /// Alias matching upstream: `unidecode_expect_ascii(string, errors, replace_str)`
 fn unidecode_expect_ascii(
-    string: &str,
+    string: &Bound<'_, PyString>,
     errors: Option<&str>,
     replace_str: Option<&str>,
 ) -> PyResult<String> {
@@ -73,7 +237,7 @@ fn unidecode_expect_ascii(
 #[pyfunction(signature = (string, errors=None, replace_str=None), text_signature = "(string, errors=None, replace_str=None)")]
 /// Alias matching upstream: `unidecode_expect_nonascii(string, errors, replace_str)`
 fn unidecode_expect_nonascii(
-    string: &str,
+    string: &Bound<'_, PyString>,
     errors: Option<&str>,
     replace_str: Option<&str>,
 ) -> PyResult<String> {
@@ -89,6 +253,12 @@ fn unidecode_rs(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     // imports transparently.
     m.add_function(wrap_pyfunction!(unidecode_expect_ascii, m)?)?;
     m.add_function(wrap_pyfunction!(unidecode_expect_nonascii, m)?)?;
+    // Batch entry point amortising call overhead over many small strings.
+    m.add_function(wrap_pyfunction!(unidecode_many, m)?)?;
+    // Surrogate-stripping batch variant used by the Python shim (private).
+    m.add_function(wrap_pyfunction!(unidecode_many_stripping, m)?)?;
+    // Surrogate pre-pass used by the Python shim (private: `_strip_surrogates`).
+    m.add_function(wrap_pyfunction!(strip_surrogates, m)?)?;
     m.add("UnidecodeError", py.get_type::<UnidecodeError>())?;
     let version = env!("CARGO_PKG_VERSION");
     m.setattr("__version__", version)?;
@@ -15,10 +15,18 @@ Rationale:
   desired, ensure overall license compatibility first.
 
 Environment / network:
-* If the network fetch fails (offline CI) we fall back to a cached local copy
-  under ``_reference/cache_test_unidecode.py`` when present.
+* Successful fetches refresh a cached local copy under
+  ``_reference/cache_test_unidecode.py`` and remember the response ETag in
+  ``cache_test_unidecode.etag``; later runs send ``If-None-Match`` and reuse
+  the cache on ``304 Not Modified`` instead of re-downloading.
+* If the network fetch fails (offline CI) we fall back to the cached local
+  copy when present.
 * If neither is available we raise ``RuntimeError`` so the harness can decide
   to skip or xfail gracefully.
+* The compiled code object is marshalled to
+  ``_reference/cache_test_unidecode.compiled`` keyed by a hash of the source
+  and the interpreter's bytecode magic, so unchanged sources skip
+  ``compile()`` on later runs.
 
 Security considerations:
 * We fetch a known trusted file from the main branch of the upstream repo.
@@ -33,11 +41,15 @@ offline.
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import marshal
 import sys
 import types
+import urllib.error
 import urllib.request
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 UPSTREAM_RAW_URL = (
     "https://raw.githubusercontent.com/avian2/Unidecode/master/tests/"
@@ -45,27 +57,86 @@ UPSTREAM_RAW_URL = (
 )
 
 CACHE_FILE = Path(__file__).with_name("cache_test_unidecode.py")
+ETAG_FILE = CACHE_FILE.with_suffix(".etag")
+COMPILED_CACHE_FILE = Path(__file__).with_name("cache_test_unidecode.compiled")
+# Length of the hex digest prefix stored in front of the marshalled code.
+_DIGEST_LEN = 16
 
 
-def _fetch_upstream() -> str:
+def _fetch_upstream() -> Tuple[str, bool]:
+    """Return ``(source, current)``.
+
+    ``current`` is true when the local cache now holds the upstream file:
+    freshly written, or confirmed by ``304 Not Modified``. It is false when
+    the source came from a stale cache after a failed fetch, or when the
+    download could not be written.
+    """
+    headers = {}
+    if CACHE_FILE.is_file() and ETAG_FILE.is_file():
+        headers["If-None-Match"] = ETAG_FILE.read_text(encoding="ascii").strip()
+    request = urllib.request.Request(UPSTREAM_RAW_URL, headers=headers)
     try:
         with urllib.request.urlopen(  # nosec B310
-            UPSTREAM_RAW_URL, timeout=15
+            request, timeout=15
         ) as resp:
             raw = resp.read()
+            etag = resp.headers.get("ETag")
         # The file declares utf-8; enforce decode.
-        return raw.decode("utf-8", errors="strict")
+        text = raw.decode("utf-8", errors="strict")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:  # cached copy is current
+            return CACHE_FILE.read_text(encoding="utf-8"), True
+        return _read_cache_or_raise(e), False
     except Exception as e:  # pragma: no cover - network variability
-        if CACHE_FILE.is_file():
-            return CACHE_FILE.read_text(encoding="utf-8")
-        raise RuntimeError(f"Unable to fetch upstream test file: {e}") from e
+        return _read_cache_or_raise(e), False
+    try:
+        CACHE_FILE.write_text(text, encoding="utf-8")
+        if etag:
+            ETAG_FILE.write_text(etag, encoding="ascii")
+        else:
+            # A previous ETag no longer describes the cached content.
+            ETAG_FILE.unlink(missing_ok=True)
+    except OSError:  # pragma: no cover - read-only checkout
+        return text, False
+    return text, True
+
+
+def _read_cache_or_raise(e: Exception) -> str:
+    if CACHE_FILE.is_file():
+        return CACHE_FILE.read_text(encoding="utf-8")
+    raise RuntimeError(f"Unable to fetch upstream test file: {e}") from e
+
+
+def _compile_upstream(source: str) -> types.CodeType:
+    """Compile the upstream source, reusing a marshalled copy when unchanged.
+
+    The cache key covers the bytecode magic number because marshal output
+    is only valid for the interpreter version that produced it.
+    """
+    digest = hashlib.blake2b(
+        importlib.util.MAGIC_NUMBER + source.encode("utf-8"),
+        digest_size=_DIGEST_LEN // 2,
+    ).hexdigest().encode("ascii")
+    try:
+        blob = COMPILED_CACHE_FILE.read_bytes()
+        if blob[:_DIGEST_LEN] == digest:
+            return marshal.loads(blob[_DIGEST_LEN:])
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # missing or corrupt cache: recompile below
+    code = compile(source, "test_unidecode.py", "exec")
+    try:
+        COMPILED_CACHE_FILE.write_bytes(digest + marshal.dumps(code))
+    except OSError:  # pragma: no cover - read-only checkout
+        pass
+    return code
 
 
 def _ensure_stub_unidecode_module() -> None:
     """Install a lightweight stub 'unidecode' module if missing.
 
-    Provides: unidecode (Rust binding), placeholders for unsupported APIs
-    so that tests referencing them fail in a controlled manner later.
+    Provides: unidecode and UnidecodeError (Rust binding), placeholders for
+    unsupported APIs so that tests referencing them fail in a controlled
+    manner later.
     """
     if "unidecode" in sys.modules:
         return
@@ -78,22 +149,20 @@ def _ensure_stub_unidecode_module() -> None:
 
     stub = types.ModuleType("unidecode")
 
-    class UnidecodeError(Exception):
-        pass
-
-    def unidecode(text: str, *_, **__) -> str:  # type: ignore
-        return unidecode_rs_mod.unidecode(text)
-
     def _unsupported(*_a, **_k):  # pragma: no cover - executed only if called
         raise NotImplementedError(
             "Feature not implemented in Rust binding yet"
         )
 
     for name, obj in (
-        ("unidecode", unidecode),
+        # Bind the implementation directly: no forwarding frame and no
+        # *args/**kwargs packing on every call.
+        ("unidecode", unidecode_rs_mod.unidecode),
         ("unidecode_expect_ascii", _unsupported),
         ("unidecode_expect_nonascii", _unsupported),
-        ("UnidecodeError", UnidecodeError),
+        # Strict-mode errors come from the binding, so assertRaises written
+        # against the stub must see the binding's exception type.
+        ("UnidecodeError", unidecode_rs_mod.UnidecodeError),
     ):
         setattr(stub, name, obj)
     sys.modules["unidecode"] = stub
@@ -106,7 +175,7 @@ def load_base_test_class() -> type:
     isolated namespace exposing the stub unidecode module.
     """
     _ensure_stub_unidecode_module()
-    source = _fetch_upstream()
+    source, _ = _fetch_upstream()
     
     class _WarningLogger(list):  # minimal stand-in
         def start(self, *_, **__):  # noqa: D401
@@ -146,7 +215,7 @@ def load_base_test_class() -> type:
         "WarningLogger": _WarningLogger,
     }
     l: Dict[str, Any] = {}
-    code = compile(source, "test_unidecode.py", "exec")
+    code = _compile_upstream(source)
     exec(code, g, l)  # noqa: S102
     base = l.get("BaseTestUnidecode") or g.get("BaseTestUnidecode")
     if not isinstance(base, type):  # pragma: no cover
@@ -156,11 +225,17 @@ def load_base_test_class() -> type:
 
 def _cmd_cache() -> int:
     try:
-        text = _fetch_upstream()
+        # Writes CACHE_FILE (and ETAG_FILE) itself on a successful fetch.
+        _, current = _fetch_upstream()
     except RuntimeError as e:
         print(f"Download failed: {e}", file=sys.stderr)
         return 1
-    CACHE_FILE.write_text(text, encoding="utf-8")
+    if not current:
+        print(
+            f"Download or write failed; {CACHE_FILE} was not refreshed",
+            file=sys.stderr,
+        )
+        return 1
     print(f"Cached upstream test file to {CACHE_FILE}")
     return 0
 
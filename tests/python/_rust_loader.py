@@ -0,0 +1,98 @@
+"""Shared, memoized resolution of the compiled ``unidecode_rs`` extension.
+
+Every Python test module needs the extension. Resolving it once per process
+(remembering a failed lookup too) keeps import-machinery work and
+``target/`` directory probing out of the individual tests.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+# Resolved once at import: Path.resolve() and is_dir() hit the filesystem,
+# so they must not be repeated per lookup.
+_TARGET_DIR = Path(__file__).resolve().parents[2] / "target"
+_DEBUG_DIR = _TARGET_DIR / "debug"
+_RELEASE_DIR = _TARGET_DIR / "release"
+_SEARCH_DIRS = tuple(d for d in (_DEBUG_DIR, _RELEASE_DIR) if d.is_dir())
+# Shared-library suffixes cargo may produce across platforms.
+_EXTENSION_SUFFIXES = (".so", ".pyd", ".dll", ".dylib")
+
+
+def _exec_spec(spec) -> ModuleType:
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_from_target() -> Optional[ModuleType]:
+    """Load a compiled artifact from ``target/{debug,release}`` by path.
+
+    ``sys.path`` is never touched: a ``FileFinder`` pinned to each directory
+    resolves an importable ``unidecode_rs<EXT_SUFFIX>`` file, and cargo's
+    ``lib``-prefixed output is matched by name.
+    """
+    for d in _SEARCH_DIRS:
+        finder = importlib.machinery.FileFinder(
+            str(d),
+            (
+                importlib.machinery.ExtensionFileLoader,
+                importlib.machinery.EXTENSION_SUFFIXES,
+            ),
+        )
+        spec = finder.find_spec("unidecode_rs")
+        tried = None
+        if spec is not None:
+            try:
+                return _exec_spec(spec)
+            except Exception:
+                # Fall back to the name match, without retrying this file.
+                tried = spec.origin
+        # One readdir per directory instead of a glob (and fnmatch) per suffix.
+        with os.scandir(d) as it:
+            candidates = [
+                e.path
+                for e in it
+                if "unidecode_rs" in e.name
+                and e.name.endswith(_EXTENSION_SUFFIXES)
+                and e.path != tried
+                and e.is_file()
+            ]
+        for path in candidates:
+            try:
+                loader = importlib.machinery.ExtensionFileLoader(
+                    "unidecode_rs", path
+                )
+                spec = importlib.util.spec_from_loader(loader.name, loader)
+                if spec is None:
+                    continue
+                return _exec_spec(spec)
+            except Exception:
+                # Try next candidate
+                continue
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_rust_module() -> Optional[ModuleType]:
+    """Return the ``unidecode_rs`` module, or ``None`` if it is unavailable.
+
+    Try a normal import first, then compiled artifacts in the local
+    ``target`` directories. The outcome, including a miss, is cached for the
+    whole process.
+    """
+    try:
+        module = importlib.import_module("unidecode_rs")
+    except Exception:
+        module = _load_from_target()
+    if module is not None:
+        sys.modules["unidecode_rs"] = module
+    return module
@@ -0,0 +1,31 @@
+"""Fixtures shared by the Python test modules."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _rust_loader():
+    # Loaded by path rather than `import _rust_loader`: under
+    # `--import-mode=importlib` this directory is not on sys.path.
+    mod = sys.modules.get("_rust_loader")
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(
+            "_rust_loader", Path(__file__).with_name("_rust_loader.py")
+        )
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules["_rust_loader"] = mod
+        spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def rust_mod():
+    # Resolution (normal import, then compiled artifacts under
+    # `target/{debug,release}`) is cached process-wide by _rust_loader.
+    mod = _rust_loader().get_rust_module()
+    if mod is None:  # pragma: no cover - environment guard
+        pytest.skip("compiled unidecode_rs not available")
+    return mod
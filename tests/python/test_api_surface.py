@@ -1,8 +1,11 @@
 import importlib
 import sys
 import subprocess
+import warnings
 from typing import Any, cast
 
+import pytest
+
 # Golden minimal API surface expectations
 EXPECTED_FUNCS = {"unidecode"}
 
@@ -58,3 +61,55 @@ def test_signature_simple():
     # The actual signature is verified by test_reference_suite.py
     assert sig is None or "(string" in sig or sig in {"(text)", "(input)"}, \
         f"Unexpected signature: {sig}"
+
+
+def test_unidecode_many_matches_single_calls(rust_mod):
+    samples = ["", "ASCII only", "déjà vu", "Русский текст", "I ♥ 🚀"]
+    assert rust_mod.unidecode_many(samples) == [rust_mod.unidecode(s) for s in samples]
+    assert rust_mod.unidecode_many(
+        samples, errors="replace", replace_str="[x]"
+    ) == [rust_mod.unidecode(s, errors="replace", replace_str="[x]") for s in samples]
+    assert rust_mod.unidecode_many([]) == []
+
+
+def _shim_module(mod):
+    # Surrogate stripping and iterable inputs are handled by the Python shim.
+    if not hasattr(mod, "_preprocess"):
+        pytest.skip("unidecode_rs resolved to the bare extension, not the shim")
+    return mod
+
+
+def test_surrogates_are_stripped_with_one_warning_each(rust_mod):
+    mod = _shim_module(rust_mod)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert mod.unidecode("a\ud800é\udfff") == "ae"
+    assert [x.category for x in w] == [RuntimeWarning, RuntimeWarning]
+    # stacklevel must point past the shim, at the caller.
+    assert {x.filename for x in w} == {__file__}
+
+
+def test_unidecode_many_strict_reports_entry_and_index(rust_mod):
+    with pytest.raises(rust_mod.UnidecodeError) as exc:
+        rust_mod.unidecode_many(["ok", "déjà", "é😀"], errors="strict")
+    assert (exc.value.item, exc.value.index) == (2, 1)
+
+
+def test_unidecode_many_strips_surrogates(rust_mod):
+    mod = _shim_module(rust_mod)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert mod.unidecode_many(["déjà", "a\ud800é"]) == ["deja", "ae"]
+    assert [x.category for x in w] == [RuntimeWarning]
+    assert w[0].filename == __file__
+
+
+def test_unidecode_many_accepts_generator(rust_mod):
+    mod = _shim_module(rust_mod)
+    samples = ["déjà vu", "Русский текст"]
+    assert mod.unidecode_many(s for s in samples) == [mod.unidecode(s) for s in samples]
+
+
+def test_unidecode_many_rejects_single_string(rust_mod):
+    with pytest.raises(TypeError):
+        rust_mod.unidecode_many("déjà")
@@ -9,86 +9,51 @@ tests are skipped rather than failing the suite.
 
 from __future__ import annotations
 
-import importlib
-import importlib.machinery
-import importlib.util
+import functools
 import inspect
-import sys
-from pathlib import Path
 
 import pytest
 
 
-def _maybe_import_rust():
-	"""Return the `unidecode_rs` module or skip tests if not available.
-
-	Try a normal import first. If that fails, search the local
-	`target/{debug,release}` directories for a compiled artifact and
-	attempt to load it by path. If still not found, skip the tests.
-	"""
-	try:
-		return importlib.import_module("unidecode_rs")
-	except Exception:
-		root = Path(__file__).resolve().parents[2]
-		for sub in ("debug", "release"):
-			d = root / "target" / sub
-			if not d.is_dir():
-				continue
-			patterns = (
-				"*unidecode_rs*.so",
-				"*unidecode_rs*.pyd",
-				"*unidecode_rs*.dll",
-				"*unidecode_rs*.dylib",
-			)
-			for pat in patterns:
-				for p in d.glob(pat):
-					try:
-						loader = importlib.machinery.ExtensionFileLoader(
-							"unidecode_rs", str(p)
-						)
-						spec = importlib.util.spec_from_loader(loader.name, loader)
-						if spec is None:
-							continue
-						module = importlib.util.module_from_spec(spec)
-						loader.exec_module(module)
-						sys.modules["unidecode_rs"] = module
-						return module
-					except Exception:
-						# Try next candidate
-						continue
-		pytest.skip("compiled unidecode_rs not available")
-
-
-def test_api_surface_matches_upstream():
-	import unidecode as py_unidecode
-
-	rust = _maybe_import_rust()
-
-	expected = (
-		"unidecode",
-		"unidecode_expect_ascii",
-		"unidecode_expect_nonascii",
-	)
-
-	for name in expected:
-		assert hasattr(py_unidecode, name), f"upstream missing {name}"
-		assert hasattr(rust, name), f"rust extension missing {name}"
-
-		py_obj = getattr(py_unidecode, name)
-		rs_obj = getattr(rust, name)
+# Public callables shared by upstream and the Rust extension.
+_NAMES = (
+	"unidecode",
+	"unidecode_expect_ascii",
+	"unidecode_expect_nonascii",
+)
+
+
+@pytest.fixture(scope="module")
+def py():
+	# Deferred to first use so collection (e.g. `-k` filtering) never pays
+	# for importing upstream; a missing package skips instead of erroring.
+	return pytest.importorskip("unidecode")
+
+
+@functools.lru_cache(maxsize=None)
+def _params(fn) -> tuple:
+	"""Parameter names of `fn`; memoized since the public surface is fixed."""
+	return tuple(inspect.signature(fn).parameters)
+
+
+def test_api_surface_matches_upstream(rust_mod, py):
+	for name in _NAMES:
+		assert hasattr(py, name), f"upstream missing {name}"
+		assert hasattr(rust_mod, name), f"rust extension missing {name}"
+
+		py_obj = getattr(py, name)
+		rs_obj = getattr(rust_mod, name)
 
 		assert callable(py_obj)
 		assert callable(rs_obj)
 
 		try:
-			py_sig = inspect.signature(py_obj)
-			rs_sig = inspect.signature(rs_obj)
-			py_params = [p.name for p in py_sig.parameters.values()]
-			rs_params = [p.name for p in rs_sig.parameters.values()]
-			assert py_params == rs_params
+			py_params = _params(py_obj)
+			rs_params = _params(rs_obj)
 		except (ValueError, TypeError):
 			# extension signatures may be opaque; skip strict check
-			pass
+			continue
+		assert py_params == rs_params
 
 
 @pytest.mark.parametrize(
@@ -102,18 +67,28 @@ def test_api_surface_matches_upstream():
 		"PŘÍLIŠ ŽLUŤOUČKÝ KŮŇ",
 	],
 )
-def test_outputs_match_for_representative_inputs(s: str) -> None:
-	import unidecode as py_unidecode
+def test_outputs_match_for_representative_inputs(s: str, rust_mod, py) -> None:
+	expected = {name: getattr(py, name)(s) for name in _NAMES}
+	actual = {name: getattr(rust_mod, name)(s) for name in _NAMES}
+	assert expected == actual
+
+
+# Inputs of at least 4 KiB of UTF-8 are transliterated with the GIL
+# released; keep these above that threshold.
+_LONG_TEXT = "déjà vu Русский текст 中文 " * 200
+_LONG_STRICT = "é" * 3000 + "🚀"
+
 
-	rust = _maybe_import_rust()
+def test_long_input_matches_upstream(rust_mod, py) -> None:
+	assert len(_LONG_TEXT.encode("utf-8")) >= 4 * 1024
+	assert rust_mod.unidecode(_LONG_TEXT) == py.unidecode(_LONG_TEXT)
 
-	assert py_unidecode.unidecode(s) == rust.unidecode(s)
-	assert (
-		py_unidecode.unidecode_expect_ascii(s)
-		== rust.unidecode_expect_ascii(s)
-	)
-	assert (
-		py_unidecode.unidecode_expect_nonascii(s)
-		== rust.unidecode_expect_nonascii(s)
-	)
 
+def test_long_input_strict_index_matches_upstream(rust_mod, py) -> None:
+	# The failing character sits past 4 KiB (6000 UTF-8 bytes in), and the
+	# reported index must count characters, not bytes.
+	with pytest.raises(py.UnidecodeError) as expected:
+		py.unidecode(_LONG_STRICT, errors="strict")
+	with pytest.raises(rust_mod.UnidecodeError) as actual:
+		rust_mod.unidecode(_LONG_STRICT, errors="strict")
+	assert actual.value.index == expected.value.index == 3000